@@ -8,9 +8,17 @@ Description:
 
 """
 
+import asyncio
+import functools
 import logging
+import queue
+import threading
+import time
 import ldap
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from ldap.filter import escape_filter_chars
 from typing import Tuple
 from .password_manager import check_password_complexity_with_reason
 from config import CONFIG
@@ -26,6 +34,134 @@ JC_BASE_DN = CONFIG.auth.ldap.jc_base_dn
 CA_CERT_FILE = CONFIG.auth.ldap.ca_cert_path
 
 
+def _config_number(value, default, cast=int):
+    """
+    Converts an optional numeric config value; ${VAR:-n} placeholders are loaded as strings.
+    """
+    if value is None or value == "":
+        return default
+    return cast(value)
+
+
+# At least 1: queue.Queue(maxsize=0) would be unbounded
+LDAP_MAX_POOL_SIZE = max(_config_number(CONFIG.auth.ldap.max_pool_size, 10), 1)
+LDAP_IDLE_TTL_S = _config_number(CONFIG.auth.ldap.idle_ttl_s, 300.0, float)
+LDAP_CACHE_MAX_SIZE = 2048
+LDAP_CACHE_TTL_HIT_S = _config_number(CONFIG.auth.ldap.cache_ttl_hit_s, 3600.0, float)
+LDAP_CACHE_TTL_MISS_S = _config_number(CONFIG.auth.ldap.cache_ttl_miss_s, 60.0, float)
+LDAP_CACHE_TTL_POLICY_S = _config_number(CONFIG.auth.ldap.cache_ttl_policy_s, 86400.0, float)
+
+
+@functools.lru_cache(maxsize=1024)
+def _make_user_dn(base_dn: str, username: str) -> str:
+    """
+    Builds a user DN; cached at module level so the cache does not keep client instances alive.
+    """
+    # A simple check for an admin user which might be located elsewhere
+    if username == "admin":
+        return f"cn=admin,{base_dn}"
+    elif username == "xops":
+        return f"uid={username},ou=service,{base_dn}"
+    else:
+        return f"uid={username},ou=people,{base_dn}"
+
+
+# Errors after which a connection cannot be used again
+_BROKEN_CONNECTION_ERRORS = (ldap.SERVER_DOWN, ldap.CONNECT_ERROR, ldap.TIMEOUT)
+
+
+class _LDAPPool:
+    """
+    A thread-safe pool of LDAP connections bound with a fixed identity.
+    Connections are created lazily and health-checked with "Who am I?" after being idle.
+    """
+
+    def __init__(self, connect, bind_dn: str, bind_password: str, max_size: int, idle_ttl: float):
+        """
+        :param connect: Callable returning a new, unbound LDAP connection object.
+        :param bind_dn: The DN every pooled connection is bound as.
+        :param bind_password: The password for bind_dn.
+        :param max_size: The maximum number of idle connections kept in the pool.
+        :param idle_ttl: Seconds a connection may sit idle before it is checked again.
+        """
+        self._connect = connect
+        self.bind_dn = bind_dn
+        self.bind_password = bind_password
+        self.idle_ttl = idle_ttl
+        self._idle = queue.Queue(maxsize=max_size)
+
+    def _new_connection(self) -> ldap.ldapobject.LDAPObject:
+        conn = self._connect()
+        try:
+            conn.simple_bind_s(self.bind_dn, self.bind_password)
+        except ldap.LDAPError:
+            self._discard(conn)
+            raise
+        return conn
+
+    @staticmethod
+    def _discard(conn: ldap.ldapobject.LDAPObject):
+        try:
+            conn.unbind_s()
+        except ldap.LDAPError:
+            pass
+
+    def acquire(self) -> Tuple[ldap.ldapobject.LDAPObject, bool]:
+        """
+        Returns a bound connection and whether it was reused from the pool.
+        """
+        try:
+            conn, last_used = self._idle.get_nowait()
+        except queue.Empty:
+            return self._new_connection(), False
+
+        if time.monotonic() - last_used > self.idle_ttl:
+            try:
+                conn.whoami_s()
+            except ldap.LDAPError as e:
+                logger.info(f"Idle LDAP connection is stale, reconnecting: {e}")
+                self._discard(conn)
+                return self._new_connection(), False
+        return conn, True
+
+    def release(self, conn: ldap.ldapobject.LDAPObject):
+        """
+        Puts a connection back into the pool, closing it if the pool is full.
+        """
+        try:
+            self._idle.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            self._discard(conn)
+
+    def _run_on(self, conn: ldap.ldapobject.LDAPObject, operation):
+        try:
+            result = operation(conn)
+        except _BROKEN_CONNECTION_ERRORS:
+            self._discard(conn)
+            raise
+        except BaseException:
+            self.release(conn)
+            raise
+        self.release(conn)
+        return result
+
+    def run(self, operation):
+        """
+        Calls operation(conn) with a pooled connection and returns its result.
+        Broken connections are dropped instead of being returned to the pool. The server
+        may have closed a reused connection at any time (restart, failover, idle timeout),
+        so in that case the operation is retried once on a new connection.
+        """
+        conn, reused = self.acquire()
+        try:
+            return self._run_on(conn, operation)
+        except _BROKEN_CONNECTION_ERRORS as e:
+            if not reused:
+                raise
+            logger.info(f"Pooled LDAP connection is broken, retrying on a new connection: {e}")
+        return self._run_on(self._new_connection(), operation)
+
+
 class OpenLDAPClient:
     """
     A class for interacting with an OpenLDAP server over TLS.
@@ -33,15 +169,24 @@ class OpenLDAPClient:
     and password expiry time lookup.
     """
 
-    def __init__(self, ldap_uri: str, base_dn: str, ca_cert_file: str = None):
+    def __init__(
+        self,
+        ldap_uri: str,
+        base_dn: str,
+        ca_cert_file: str = None,
+        admin_user: str = XOPS_USERNAME,
+        admin_password: str = XOPS_PASSWORD,
+    ):
         """
-        Initializes the LDAP connection details.
+        Initializes the LDAP connection details and the admin connection pool.
         :param ldap_uri: The URI of the LDAP server, must be a TLS address starting with "ldaps://",
                          e.g., "ldaps://ldap.example.com:636"
         :param base_dn: The base Distinguished Name (DN) of the LDAP directory tree,
                         e.g., "dc=example,dc=com"
         :param ca_cert_file: (Optional) The path to the CA certificate file. Providing this
                              enables server certificate validation for enhanced security.
+        :param admin_user: The administrator username the pooled connections are bound as.
+        :param admin_password: The administrator's password.
         """
         if not ldap_uri.startswith("ldaps://"):
             raise ValueError("LDAP URI must start with 'ldaps://' for a TLS connection.")
@@ -49,26 +194,49 @@ class OpenLDAPClient:
         self.ldap_uri = ldap_uri
         self.base_dn = base_dn
         self.ca_cert_file = ca_cert_file
+        self.admin_user = admin_user
+
+        if not ca_cert_file:
+            logger.warning("No CA certificate file provided. Server certificate will not be verified.")
+
+        # Admin lookups are cached; "user not found" results are kept for a shorter time
+        self._cache_lock = threading.RLock()
+        self._caches = {
+            kind: (
+                TTLCache(maxsize=LDAP_CACHE_MAX_SIZE, ttl=LDAP_CACHE_TTL_HIT_S),
+                TTLCache(maxsize=LDAP_CACHE_MAX_SIZE, ttl=LDAP_CACHE_TTL_MISS_S),
+            )
+            for kind in ("user_info", "expiry")
+        }
+        # Password policies rarely change: policy DN -> pwdMaxAge
+        self._policy_max_age_cache = TTLCache(maxsize=64, ttl=LDAP_CACHE_TTL_POLICY_S)
+        self._pool = _LDAPPool(
+            self._get_connection,
+            self._get_user_dn(admin_user),
+            admin_password,
+            max_size=LDAP_MAX_POOL_SIZE,
+            idle_ttl=LDAP_IDLE_TTL_S,
+        )
 
     def _get_connection(self) -> ldap.ldapobject.LDAPObject:
         """
-        Establishes and returns an LDAP connection object with TLS options configured.
+        Establishes and returns an LDAP connection object with this client's TLS options configured.
         """
+        conn = ldap.initialize(self.ldap_uri)
+        # Options are set on the connection, not library-wide, so clients with different CAs don't interfere
+        # Set the protocol version to LDAPv3
+        conn.set_option(ldap.OPT_PROTOCOL_VERSION, ldap.VERSION3)
         if self.ca_cert_file:
             # Most secure option: Requires validation of the server certificate
-            ldap.set_option(ldap.OPT_X_TLS_CACERTFILE, self.ca_cert_file)
-            ldap.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
+            conn.set_option(ldap.OPT_X_TLS_CACERTFILE, self.ca_cert_file)
+            conn.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_DEMAND)
         else:
             # WARNING: Not recommended for production. This allows connecting to any TLS endpoint
             # without verifying its identity. Use only for local testing or with self-signed
             # server certificates where the CA is not available.
-            ldap.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_ALLOW)
-            logging.warning("No CA certificate file provided. Server certificate will not be verified.")
-
-        # Set the protocol version to LDAPv3
-        ldap.set_option(ldap.OPT_PROTOCOL_VERSION, ldap.VERSION3)
-
-        conn = ldap.initialize(self.ldap_uri)
+            conn.set_option(ldap.OPT_X_TLS_REQUIRE_CERT, ldap.OPT_X_TLS_ALLOW)
+        # Create the connection's own TLS context from the options above
+        conn.set_option(ldap.OPT_X_TLS_NEWCTX, 0)
         return conn
 
     def _get_user_dn(self, username: str) -> str:
@@ -76,13 +244,52 @@ class OpenLDAPClient:
         Constructs the full user DN based on the username.
         Assumes user entries are under "ou=people" and use "uid" as the unique identifier.
         """
-        # A simple check for an admin user which might be located elsewhere
-        if username == "admin":
-            return f"cn=admin,{self.base_dn}"
-        elif username == "xops":
-            return f"uid={username},ou=service,{self.base_dn}"
-        else:
-            return f"uid={username},ou=people,{self.base_dn}"
+        return _make_user_dn(self.base_dn, username)
+
+    def _is_admin_identity(self, bind_user: str, bind_password: str) -> bool:
+        return bind_user == self.admin_user and bind_password == self._pool.bind_password
+
+    def _cache_get(self, kind: str, username: str):
+        """
+        Returns a copy of the cached result for username, or None on a cache miss.
+        """
+        with self._cache_lock:
+            for cache in self._caches[kind]:
+                value = cache.get(username)
+                if value is not None:
+                    return dict(value)
+        return None
+
+    def _cache_put(self, kind: str, username: str, value: dict, found: bool = True) -> dict:
+        """
+        Stores a result in the positive (found) or negative cache and returns it.
+        """
+        hit_cache, miss_cache = self._caches[kind]
+        with self._cache_lock:
+            (hit_cache if found else miss_cache)[username] = value
+        return dict(value)
+
+    def _cache_invalidate(self, username: str):
+        with self._cache_lock:
+            for caches in self._caches.values():
+                for cache in caches:
+                    cache.pop(username, None)
+
+    def _run_bound(self, bind_user: str, bind_password: str, operation):
+        """
+        Calls operation(conn) with a connection bound as bind_user and returns its result.
+        The admin identity is served from the connection pool; any other identity gets
+        a short-lived connection.
+        """
+        if self._is_admin_identity(bind_user, bind_password):
+            return self._pool.run(operation)
+
+        conn = self._get_connection()
+        try:
+            conn.simple_bind_s(self._get_user_dn(bind_user), bind_password)
+            return operation(conn)
+        finally:
+            conn.unbind_s()
 
     def authenticate(self, username: str, password: str) -> Tuple[bool, str]:
         """
@@ -99,19 +306,19 @@ class OpenLDAPClient:
             # Attempt to bind as the user. If successful, the credentials are valid.
             conn.simple_bind_s(user_dn, password)
             msg = f"Authentication successful for user: {username}"
-            logging.info(msg)
+            logger.info(msg)
             return True, msg
         except ldap.INVALID_CREDENTIALS:
             msg = f"Authentication failed: Invalid credentials for user {username}."
-            logging.warning(msg)
+            logger.warning(msg)
             return False, msg
         except ldap.SERVER_DOWN as e:
             msg = f"LDAP server is down or unreachable: {e}"
-            logging.error(msg)
+            logger.error(msg)
             return False, msg
         except ldap.LDAPError as e:
             msg = f"An LDAP error occurred during authentication for {username}: {e}"
-            logging.error(msg)
+            logger.error(msg)
             return False, msg
         finally:
             # Ensure the connection is closed
@@ -141,20 +348,21 @@ class OpenLDAPClient:
             # Use the LDAP password modify extended operation
             conn.passwd_s(user_dn, old_password.encode("utf-8"), new_password.encode("utf-8"))
 
-            logging.info(f"Password changed successfully for user: {username}")
+            self._cache_invalidate(username)
+            logger.info(f"Password changed successfully for user: {username}")
             return True, "Password changed successfully."
         except ldap.INVALID_CREDENTIALS:
-            logging.warning(f"Password change failed for {username}: Invalid old password.")
+            logger.warning(f"Password change failed for {username}: Invalid old password.")
             return False, "Invalid old password."
         except ldap.UNWILLING_TO_PERFORM as e:
             # Usually indicates that the new password does not meet the server's policy
-            logging.error(f"Password change failed for {username}: Password does not meet policy. Server says: {e}")
+            logger.error(f"Password change failed for {username}: Password does not meet policy. Server says: {e}")
             return False, "New password does not meet the complexity/history policy."
         except ldap.SERVER_DOWN as e:
-            logging.error(f"LDAP server is down or unreachable: {e}")
+            logger.error(f"LDAP server is down or unreachable: {e}")
             return False, "LDAP server is unavailable."
         except ldap.LDAPError as e:
-            logging.error(f"An LDAP error occurred during password change for {username}: {e}")
+            logger.error(f"An LDAP error occurred during password change for {username}: {e}")
             return False, f"An LDAP error occurred: {e}"
         finally:
             conn.unbind_s()
@@ -174,131 +382,214 @@ class OpenLDAPClient:
         bind_user = admin_user or username_to_query
         bind_password = admin_password or ""  # 如果查询自己，密码必须传
 
-        user_dn = self._get_user_dn(bind_user)
-        conn = self._get_connection()
+        # 仅缓存管理员身份的查询结果，自己绑定时仍需校验密码
+        use_cache = self._is_admin_identity(bind_user, bind_password)
+        if use_cache:
+            cached = self._cache_get("user_info", username_to_query)
+            if cached is not None:
+                return cached
 
         try:
-            # 绑定
-            conn.simple_bind_s(user_dn, bind_password)
-
             # 搜索用户条目
-            search_filter = f"(uid={username_to_query})"
+            search_filter = f"(uid={escape_filter_chars(username_to_query)})"
             # 查询常用属性，可根据实际 LDAP schema 增加
             search_attributes = ["uid", "cn", "mail", "displayName", "sn", "givenName", "ou"]
 
-            result = conn.search_s(self.base_dn, ldap.SCOPE_SUBTREE, search_filter, search_attributes)
+            # 绑定后搜索 (管理员身份复用连接池)
+            result = self._run_bound(
+                bind_user,
+                bind_password,
+                lambda conn: conn.search_s(self.base_dn, ldap.SCOPE_SUBTREE, search_filter, search_attributes),
+            )
 
             if not result:
-                return {"message": f"User '{username_to_query}' not found."}
+                msg = {"message": f"User '{username_to_query}' not found."}
+                return self._cache_put("user_info", username_to_query, msg, found=False) if use_cache else msg
 
             user_entry = result[0][1]
 
-            # 将 bytes 转为 str
-            user_info = {k: v[0].decode("utf-8") if isinstance(v[0], bytes) else v[0] for k, v in user_entry.items()}
+            # 将 bytes 转为 str (python-ldap 返回的属性值均为 bytes)
+            user_info = {k: v[0].decode("utf-8", "replace") for k, v in user_entry.items() if v}
 
-            return user_info
+            return self._cache_put("user_info", username_to_query, user_info) if use_cache else user_info
 
         except ldap.INVALID_CREDENTIALS:
             msg = f"Invalid credentials for user '{bind_user}'."
-            logging.error(msg)
+            logger.error(msg)
             return {"message": msg}
         except ldap.LDAPError as e:
             msg = f"LDAP error occurred while querying '{username_to_query}': {e}"
-            logging.error(msg)
+            logger.error(msg)
             return {"message": msg}
-        finally:
-            conn.unbind_s()
 
-    def get_password_expiry_info(
-        self, username_to_query: str, admin_user: str = XOPS_USERNAME, admin_password: str = XOPS_PASSWORD
-    ) -> dict:
+    def _query_password_expiry_info(
+        self, conn: ldap.ldapobject.LDAPObject, username_to_query: str
+    ) -> Tuple[bool, dict]:
         """
-        Queries the password expiry information for a specified user.
-        Requires administrator privileges to read password policy operational attributes.
+        Runs the password expiry lookup on an already bound connection.
 
-        This functionality requires the OpenLDAP server to have the ppolicy (Password Policy)
-        overlay enabled.
-
-        :param admin_user: An administrator username with rights to read operational attributes.
-        :param admin_password: The administrator's password.
-        :param username_to_query: The username of the user whose password expiry information is to be queried.
-        :return: A dictionary containing expiry information, e.g.,
-                 {'expiry_date': datetime_obj, 'days_left': 10, 'message': '...'}
-                 or a message if the password never expires or information cannot be retrieved.
+        :return: A tuple (bool, dict): False if the user does not exist, and the expiry information.
         """
-        admin_dn = self._get_user_dn(admin_user)
-        conn = self._get_connection()
-
-        try:
-            # Bind as the administrator to gain necessary permissions
-            conn.simple_bind_s(admin_dn, admin_password)
+        # Query the user's password policy-related attributes
+        # We need to search for the user and request operational attributes '+' or specific ones like 'pwdChangedTime'
+        search_filter = f"(uid={escape_filter_chars(username_to_query)})"
+        search_attributes = ["pwdChangedTime", "pwdPolicySubentry"]
 
-            # Query the user's password policy-related attributes
-            # We need to search for the user and request operational attributes '+' or specific ones like 'pwdChangedTime'
-            search_filter = f"(uid={username_to_query})"
-            search_attributes = ["pwdChangedTime", "pwdPolicySubentry"]
+        # The search must be performed on the base_dn
+        result = conn.search_s(self.base_dn, ldap.SCOPE_SUBTREE, search_filter, search_attributes)
 
-            # The search must be performed on the base_dn
-            result = conn.search_s(self.base_dn, ldap.SCOPE_SUBTREE, search_filter, search_attributes)
+        if not result:
+            return False, {"message": f"User '{username_to_query}' not found."}
 
-            if not result:
-                return {"message": f"User '{username_to_query}' not found."}
+        user_entry = result[0][1]
 
-            user_entry = result[0][1]
+        if "pwdChangedTime" not in user_entry:
+            return True, {
+                "message": "Could not retrieve password last changed time. ppolicy overlay may not be active."
+            }
 
-            if "pwdChangedTime" not in user_entry:
-                return {"message": "Could not retrieve password last changed time. ppolicy overlay may not be active."}
+        # Parse the last password change time, a fixed-width GeneralizedTime such as b"20240101120000Z"
+        s = user_entry["pwdChangedTime"][0]
+        pwd_changed_time = datetime(
+            int(s[0:4]), int(s[4:6]), int(s[6:8]), int(s[8:10]), int(s[10:12]), int(s[12:14]), tzinfo=timezone.utc
+        )
 
-            # Parse the last password change time
-            changed_time_str = user_entry["pwdChangedTime"][0].decode("utf-8").rstrip("Z")
-            pwd_changed_time = datetime.strptime(changed_time_str, "%Y%m%d%H%M%S")
+        # Get the password policy
+        if "pwdPolicySubentry" not in user_entry:
+            return True, {"message": "User is not subject to any password policy."}
 
-            # Get the password policy
-            if "pwdPolicySubentry" not in user_entry:
-                return {"message": "User is not subject to any password policy."}
+        policy_dn = user_entry["pwdPolicySubentry"][0].decode("utf-8")
 
-            policy_dn = user_entry["pwdPolicySubentry"][0].decode("utf-8")
+        with self._cache_lock:
+            pwd_max_age_seconds = self._policy_max_age_cache.get(policy_dn)
 
+        if pwd_max_age_seconds is None:
             # Query the policy itself to get pwdMaxAge
             policy_result = conn.search_s(policy_dn, ldap.SCOPE_BASE, attrlist=["pwdMaxAge"])
 
             if not policy_result or "pwdMaxAge" not in policy_result[0][1]:
-                return {"message": "Could not retrieve pwdMaxAge from the password policy."}
+                return True, {"message": "Could not retrieve pwdMaxAge from the password policy."}
 
             pwd_max_age_seconds = int(policy_result[0][1]["pwdMaxAge"][0])
+            with self._cache_lock:
+                self._policy_max_age_cache[policy_dn] = pwd_max_age_seconds
 
-            if pwd_max_age_seconds == 0:
-                return {"expiry_date": None, "days_left": float("inf"), "message": "Password is set to never expire."}
+        if pwd_max_age_seconds == 0:
+            return True, {"expiry_date": None, "days_left": float("inf"), "message": "Password is set to never expire."}
 
-            # Calculate the expiry date
-            expiry_date_naive = pwd_changed_time + timedelta(seconds=pwd_max_age_seconds)
-            expiry_date_aware = expiry_date_naive.replace(tzinfo=timezone.utc)
-            now_utc = datetime.now(timezone.utc)
+        # Calculate the expiry date
+        expiry_date_aware = pwd_changed_time + timedelta(seconds=pwd_max_age_seconds)
+        now_utc = datetime.now(timezone.utc)
 
-            days_left = (expiry_date_aware - now_utc).days
-            return {
-                "expiry_date": expiry_date_aware,
-                "days_left": days_left,
-                "last_changed": pwd_changed_time,
-                "message": f"Password expires on {expiry_date_aware.isoformat()} UTC.",
-            }
+        days_left = (expiry_date_aware - now_utc).days
+        return True, {
+            "expiry_date": expiry_date_aware,
+            "days_left": days_left,
+            "last_changed": pwd_changed_time,
+            "message": f"Password expires on {expiry_date_aware.isoformat()} UTC.",
+        }
+
+    def get_password_expiry_info(
+        self, username_to_query: str, admin_user: str = XOPS_USERNAME, admin_password: str = XOPS_PASSWORD
+    ) -> dict:
+        """
+        Queries the password expiry information for a specified user.
+        Requires administrator privileges to read password policy operational attributes.
+
+        This functionality requires the OpenLDAP server to have the ppolicy (Password Policy)
+        overlay enabled.
+
+        :param admin_user: An administrator username with rights to read operational attributes.
+        :param admin_password: The administrator's password.
+        :param username_to_query: The username of the user whose password expiry information is to be queried.
+        :return: A dictionary containing expiry information, e.g.,
+                 {'expiry_date': datetime_obj, 'days_left': 10, 'message': '...'}
+                 or a message if the password never expires or information cannot be retrieved.
+        """
+        use_cache = self._is_admin_identity(admin_user, admin_password)
+        if use_cache:
+            cached = self._cache_get("expiry", username_to_query)
+            if cached is not None:
+                if cached.get("expiry_date") is not None:
+                    cached["days_left"] = (cached["expiry_date"] - datetime.now(timezone.utc)).days
+                return cached
+
+        try:
+            # Bind as the administrator (served from the connection pool) to gain necessary permissions
+            found, info = self._run_bound(
+                admin_user, admin_password, lambda conn: self._query_password_expiry_info(conn, username_to_query)
+            )
+            return self._cache_put("expiry", username_to_query, info, found=found) if use_cache else info
 
         except ldap.INSUFFICIENT_ACCESS:
             msg = f"Admin user '{admin_user}' does not have sufficient rights to read password policy attributes."
-            logging.error(msg)
+            logger.error(msg)
             return {"message": msg}
         except ldap.NO_SUCH_OBJECT:
             msg = f"User '{username_to_query}' or required policy object not found."
-            logging.error(msg)
+            logger.error(msg)
             return {"message": msg}
         except ldap.LDAPError as e:
-            logging.error(f"An LDAP error occurred while querying expiry for {username_to_query}: {e}")
+            logger.error(f"An LDAP error occurred while querying expiry for {username_to_query}: {e}")
             return {"message": f"An LDAP error occurred: {e}"}
-        finally:
-            conn.unbind_s()
+
+
+class AsyncOpenLDAPClient:
+    """
+    asyncio wrapper around OpenLDAPClient.
+    python-ldap calls are blocking, so they run in a thread pool sized to the
+    connection pool; the wrapped client's pooled connections and caches are shared.
+    """
+
+    def __init__(self, client: OpenLDAPClient, max_workers: int = LDAP_MAX_POOL_SIZE):
+        """
+        :param client: The synchronous client doing the actual LDAP work.
+        :param max_workers: The maximum number of LDAP calls running at the same time.
+        """
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ldap")
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def authenticate(self, username: str, password: str) -> Tuple[bool, str]:
+        """
+        Async version of OpenLDAPClient.authenticate.
+        """
+        return await self._run(self.client.authenticate, username, password)
+
+    async def change_password(self, username: str, old_password: str, new_password: str) -> Tuple[bool, str]:
+        """
+        Async version of OpenLDAPClient.change_password.
+        """
+        return await self._run(self.client.change_password, username, old_password, new_password)
+
+    async def get_user_info(
+        self, username_to_query: str, admin_user: str = XOPS_USERNAME, admin_password: str = XOPS_PASSWORD
+    ) -> dict:
+        """
+        Async version of OpenLDAPClient.get_user_info.
+        """
+        return await self._run(self.client.get_user_info, username_to_query, admin_user, admin_password)
+
+    async def get_password_expiry_info(
+        self, username_to_query: str, admin_user: str = XOPS_USERNAME, admin_password: str = XOPS_PASSWORD
+    ) -> dict:
+        """
+        Async version of OpenLDAPClient.get_password_expiry_info.
+        """
+        return await self._run(self.client.get_password_expiry_info, username_to_query, admin_user, admin_password)
+
+    def close(self):
+        """
+        Shuts down the thread pool, waiting for running LDAP calls to finish.
+        """
+        self._executor.shutdown(wait=True)
 
 
 ldap_client = OpenLDAPClient(ldap_uri=JC_LDAP_SERVER_URI, base_dn=JC_BASE_DN)
+async_ldap_client = AsyncOpenLDAPClient(ldap_client)
 
 if __name__ == "__main__":
     LOG_HANDLERS = [
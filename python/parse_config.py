@@ -16,6 +16,12 @@ from dotenv import load_dotenv, dotenv_values
 import yaml
 from pathlib import Path
 
+try:
+    # libyaml C parser, much faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 logger = logging.getLogger(__name__)
 ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)(?::-([^\}]+))?\}")
 
@@ -51,23 +57,52 @@ def load_yml(path: str) -> dict:
     """
     Load a YAML file and return a dict.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+    # Binary mode lets the loader decode the UTF-8 stream itself
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+# path -> (mtime_ns, parsed data), only used by Config
+_YML_CACHE = {}
+
+
+def _load_yml_cached(path: str) -> dict:
+    """
+    load_yml cached until the file's mtime changes.
+    The returned dict is shared; Config only reads it, since merging and
+    env var replacement build new dicts.
+    """
+    path = os.fspath(path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _YML_CACHE.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+
+    data = load_yml(path)
+    _YML_CACHE[path] = (mtime, data)
+    return data
 
 
 def _merge_dict(base: dict, override: dict) -> dict:
     """
-    Recursively merge two dictionaries.
+    Merge two dictionaries, walking nested levels with an explicit stack.
     - Nested dicts are merged.
     - Values of different types or non-dict are overridden.
     - Returns a new merged dict without modifying the inputs.
+      Only the nested dicts that are overridden get copied.
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = _merge_dict(result[key], value)
-        else:
-            result[key] = value
+    result = dict(base)
+    stack = [(result, override)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            current = dst.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                merged = dict(current)
+                dst[key] = merged
+                stack.append((merged, value))
+            else:
+                dst[key] = value
     return result
 
 
@@ -82,21 +117,27 @@ def _replace_env_vars(obj, env_dict: dict):
       replaced with an empty string.
     """
 
+    get = env_dict.get
+
     def replacer(match):
-        var_name = match.group(1)
-        default_val = match.group(2) or ""
-        return str(env_dict.get(var_name, default_val))
-
-    if isinstance(obj, dict):
-        return {k: _replace_env_vars(v, env_dict) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [_replace_env_vars(i, env_dict) for i in obj]
-    elif isinstance(obj, str):
         # m.group(1) is the variable name.
         # m.group(2) is the default value (or None).
-        return ENV_VAR_PATTERN.sub(replacer, obj)
-    else:
-        return obj
+        return str(get(match.group(1), match.group(2) or ""))
+
+    def replace(value):
+        if isinstance(value, dict):
+            return {k: replace(v) for k, v in value.items()}
+        elif isinstance(value, list):
+            return [replace(i) for i in value]
+        elif isinstance(value, str):
+            # Most strings have no placeholder, skip the regex for them
+            if "${" not in value:
+                return value
+            return ENV_VAR_PATTERN.sub(replacer, value)
+        else:
+            return value
+
+    return replace(obj)
 
 
 class DotDict(dict):
@@ -108,7 +149,9 @@ class DotDict(dict):
     def __getattr__(self, item):
         value = self.get(item)
         if isinstance(value, dict) and not isinstance(value, DotDict):
+            # Plain dicts assigned after loading are wrapped once and stored back
             value = DotDict(value)
+            dict.__setitem__(self, item, value)
         return value
 
     __setattr__ = dict.__setitem__
@@ -125,6 +168,14 @@ class DotDict(dict):
         return list(self.keys()) + super().__dir__()
 
 
+def _to_dot_dict(obj: dict) -> DotDict:
+    """
+    Wrap a dict and all of its nested dicts in DotDict, so attribute
+    access does not need to create wrappers on every lookup.
+    """
+    return DotDict({k: _to_dot_dict(v) if isinstance(v, dict) else v for k, v in obj.items()})
+
+
 class Config:
     """
     Config loader with YAML + .env + environment variable support.
@@ -151,7 +202,7 @@ class Config:
         # 1. Merge YAML files
         merged = {}
         for path in self.yml_paths:
-            data = load_yml(path)
+            data = _load_yml_cached(path)
             if data:
                 merged = _merge_dict(merged, data)
 
@@ -159,8 +210,8 @@ class Config:
         merged = _replace_env_vars(merged, self.env_dict)
         # merged = _replace_env_vars(merged, os.environ)
 
-        # 3. Wrap in DotDict
-        self._data = DotDict(merged)
+        # 3. Wrap in DotDict (nested dicts included)
+        self._data = _to_dot_dict(merged)
 
     def __getattr__(self, item):
         return getattr(self._data, item)
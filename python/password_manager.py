@@ -9,11 +9,36 @@ Description:
 """
 
 import logging
-from typing import Dict, Tuple
+import string
+from typing import Dict, Optional, Tuple
 import math
 
 logger = logging.getLogger(__name__)
 
+_LOWER = frozenset(string.ascii_lowercase)
+_UPPER = frozenset(string.ascii_uppercase)
+_DIGIT = frozenset(string.digits)
+_ALNUM = _LOWER | _UPPER | _DIGIT
+
+# log2 of the charset size for every lower/upper/digit/special combination (bits 0-3)
+_CHARSET_SIZES = (26, 26, 10, 32)  # 32: Common special character count
+_LOG2_CHARSET_SIZE = tuple(
+    math.log2(size) if size else 0.0
+    for size in (sum(n for bit, n in enumerate(_CHARSET_SIZES) if mask >> bit & 1) for mask in range(16))
+)
+
+KEYBOARD_ROWS = ("qwertyuiop", "asdfghjkl", "zxcvbnm")
+
+
+def _build_keyboard_sequences(length: int) -> frozenset:
+    """Build the set of keyboard row substrings of the given length, in both directions."""
+    seqs = {row[i : i + length] for row in KEYBOARD_ROWS for i in range(len(row) - length + 1)}
+    return frozenset(seqs | {seq[::-1] for seq in seqs})
+
+
+# Precomputed for the common lengths, so each window check is a set lookup
+_KEYBOARD_SEQUENCES = {length: _build_keyboard_sequences(length) for length in (3, 4)}
+
 
 def password_length_valid(password: str, min_len: int = 12, max_len: int = 32) -> Tuple[bool, str]:
     """Check if the password length is within the specified range."""
@@ -26,17 +51,45 @@ def password_length_valid(password: str, min_len: int = 12, max_len: int = 32) -
     return True, "Password length is valid."
 
 
-def password_has_min_types(password: str, min_types: int = 3) -> Tuple[bool, str]:
-    """Check if the password contains at least min_types of character categories."""
+def _classify(password: str) -> Dict[str, bool]:
+    """Find the character categories used in the password in a single pass."""
+    if password.isascii():
+        # Set operations run in C; for ASCII the categories are exactly the sets above
+        chars = set(password)
+        return {
+            "lower": not chars.isdisjoint(_LOWER),
+            "upper": not chars.isdisjoint(_UPPER),
+            "digit": not chars.isdisjoint(_DIGIT),
+            "special": bool(chars - _ALNUM),
+        }
+    has_lower = has_upper = has_digit = has_special = False
+    for c in password:
+        if c.islower():
+            has_lower = True
+        elif c.isupper():
+            has_upper = True
+        elif c.isdigit():
+            has_digit = True
+        # Checked separately: some cased characters (e.g. "Ⓐ") are not alphanumeric
+        if not c.isalnum():
+            has_special = True
+        if has_lower and has_upper and has_digit and has_special:
+            break
+    return {"lower": has_lower, "upper": has_upper, "digit": has_digit, "special": has_special}
+
+
+def password_has_min_types(
+    password: str, min_types: int = 3, charsets: Optional[Dict[str, bool]] = None
+) -> Tuple[bool, str]:
+    """Check if the password contains at least min_types of character categories.
+
+    charsets may be passed in when the categories were already computed by _classify.
+    """
     if not password:
         return False, "Password cannot be empty."
-    checks = [
-        any(c.islower() for c in password),  # Lowercase letters
-        any(c.isupper() for c in password),  # Uppercase letters
-        any(c.isdigit() for c in password),  # Digits
-        any(not c.isalnum() for c in password),  # Special characters
-    ]
-    types_found = sum(checks)
+    if charsets is None:
+        charsets = _classify(password)
+    types_found = sum(charsets.values())
     if types_found >= min_types:
         return True, "Password contains sufficient character variety."
     return False, f"Password must contain at least {min_types} types of characters, found {types_found}."
@@ -46,14 +99,27 @@ def contains_sequential_chars(password: str, length: int = 3) -> Tuple[bool, str
     """Check if the password contains sequential characters (ascending or descending)."""
     if len(password) < length:
         return False, "Password too short to check for sequential characters."
+    if length < 1:
+        raise ValueError("Sequence length must be at least 1.")
     pw = password.lower()
-    for i in range(len(pw) - length + 1):
-        substr = pw[i : i + length]
-        if substr.isalpha() or substr.isdigit():
-            is_seq = all(ord(substr[j + 1]) - ord(substr[j]) == 1 for j in range(length - 1))
-            is_rev_seq = all(ord(substr[j]) - ord(substr[j + 1]) == 1 for j in range(length - 1))
-            if is_seq or is_rev_seq:
-                return False, f"Sequential character pattern detected: {substr}"
+    if length == 1:
+        # Any single letter or digit counts as a sequence of length 1
+        for c in pw:
+            if c.isalpha() or c.isdigit():
+                return False, f"Sequential character pattern detected: {c}"
+        return True, "No sequential character pattern detected."
+    # Lengths of the ascending/descending runs ending at pw[i], counted in characters
+    up = down = 1
+    for i in range(1, len(pw)):
+        prev, cur = pw[i - 1], pw[i]
+        if (prev.isalpha() and cur.isalpha()) or (prev.isdigit() and cur.isdigit()):
+            delta = ord(cur) - ord(prev)
+            up = up + 1 if delta == 1 else 1
+            down = down + 1 if delta == -1 else 1
+        else:
+            up = down = 1
+        if up >= length or down >= length:
+            return False, f"Sequential character pattern detected: {pw[i - length + 1 : i + 1]}"
     return True, "No sequential character pattern detected."
 
 
@@ -62,12 +128,11 @@ def contains_sequential_keyboard(password: str, length: int = 3) -> Tuple[bool,
     if len(password) < length:
         return False, "Password too short to check for keyboard sequences."
     pw = password.lower()
-    keyboard_rows = ["qwertyuiop", "asdfghjkl", "zxcvbnm"]
+    seqs = _KEYBOARD_SEQUENCES.get(length) or _build_keyboard_sequences(length)
 
     for i in range(len(pw) - length + 1):
         substr = pw[i : i + length]
-        rev_substr = substr[::-1]
-        if any(substr in row or rev_substr in row for row in keyboard_rows):
+        if substr in seqs:
             return False, f"Keyboard pattern detected: {substr}"
     return True, "No keyboard pattern detected."
 
@@ -91,19 +156,15 @@ def calculate_entropy(password: str, charsets: Dict[str, bool], threshold: float
     """Calculate entropy based on used character sets and check if it meets the threshold."""
     if not password:
         return False, "Password cannot be empty."
-    charset_size = 0
-    if charsets.get("lower"):
-        charset_size += 26
-    if charsets.get("upper"):
-        charset_size += 26
-    if charsets.get("digit"):
-        charset_size += 10
-    if charsets.get("special"):
-        charset_size += 32  # Common special character count
-    if charset_size == 0:
+    mask = (
+        bool(charsets.get("lower"))
+        | bool(charsets.get("upper")) << 1
+        | bool(charsets.get("digit")) << 2
+        | bool(charsets.get("special")) << 3
+    )
+    if mask == 0:
         return False, "No valid character set detected."
-    entropy = len(password) * math.log2(charset_size)
-    entropy = round(entropy, 2)
+    entropy = round(len(password) * _LOG2_CHARSET_SIZE[mask], 2)
     if entropy >= threshold:
         return True, f"Password entropy is {entropy}, which meets the requirement."
     return False, f"Password entropy is {entropy}, which is below the threshold of {threshold}."
@@ -111,21 +172,14 @@ def calculate_entropy(password: str, charsets: Dict[str, bool], threshold: float
 
 def check_password_complexity_with_reason(password: str) -> Tuple[bool, str]:
     """Validate password using multiple checks and return result with reason."""
+    charsets = _classify(password)
     checks = [
         password_length_valid(password),
-        password_has_min_types(password),
+        password_has_min_types(password, charsets=charsets),
         contains_sequential_chars(password),
         contains_sequential_keyboard(password),
         contains_repeated_chars(password),
-        calculate_entropy(
-            password,
-            {
-                "lower": any(c.islower() for c in password),
-                "upper": any(c.isupper() for c in password),
-                "digit": any(c.isdigit() for c in password),
-                "special": any(not c.isalnum() for c in password),
-            },
-        ),
+        calculate_entropy(password, charsets),
     ]
     for passed, reason in checks:
         if not passed:
@@ -8,6 +8,7 @@ Description:
     time zone
 """
 
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,13 +17,42 @@ from zoneinfo import ZoneInfo
 from datetime import datetime, timedelta
 from config import CONFIG
 
-DATETIME_FORMAT = CONFIG.datetime.format
-DATETIME_TIMEZONE = CONFIG.datetime.timezone
+
+@functools.lru_cache(maxsize=32)
+def _zone_info(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+@functools.lru_cache(maxsize=8)
+def _split_format(format_str: str) -> tuple:
+    """
+    拆分日期时间格式为 (日期格式, 时间格式)
+    """
+    date_fmt, _, time_fmt = format_str.partition(" ")
+    return date_fmt, time_fmt
 
 
 class TimeZone:
-    def __init__(self, tz: str = DATETIME_TIMEZONE):
-        self.tz_info = ZoneInfo(tz)
+    """
+    未指定的时区和格式在使用时才从 CONFIG.datetime 读取
+    """
+
+    def __init__(self, tz: str = None):
+        self._tz = tz
+        self._tz_info = None  # 直接赋值 tz_info 时的覆盖值
+        if tz:
+            # 显式传入的时区立即校验
+            _zone_info(tz)
+
+    @property
+    def tz_info(self) -> ZoneInfo:
+        if self._tz_info is not None:
+            return self._tz_info
+        return _zone_info(self._tz or CONFIG.datetime.timezone)
+
+    @tz_info.setter
+    def tz_info(self, value: ZoneInfo):
+        self._tz_info = value
 
     def now(self) -> datetime:
         """
@@ -32,25 +62,25 @@ class TimeZone:
         """
         return datetime.now(self.tz_info)
 
-    def now_str(self, format_str: str = DATETIME_FORMAT) -> str:
+    def now_str(self, format_str: str = None) -> str:
         """
         获取时区时间字符串
 
         :param format_str:
         :return:
         """
-        return datetime.now(self.tz_info).strftime(format_str)
+        return datetime.now(self.tz_info).strftime(format_str or CONFIG.datetime.format)
 
-    def f_dt_str(self, dt: datetime, format_str: str = DATETIME_FORMAT) -> str:
+    def f_dt_str(self, dt: datetime, format_str: str = None) -> str:
         """
         datetime 时间转时区时间字符串
         :param dt:
         :param format_str:
         :return:
         """
-        return dt.astimezone(self.tz_info).strftime(format_str)
+        return dt.astimezone(self.tz_info).strftime(format_str or CONFIG.datetime.format)
 
-    def f_str(self, date_str: str, format_str: str = DATETIME_FORMAT) -> datetime:
+    def f_str(self, date_str: str, format_str: str = None) -> datetime:
         """
         时间字符串转时区时间
 
@@ -58,44 +88,43 @@ class TimeZone:
         :param format_str:
         :return:
         """
-        return datetime.strptime(date_str, format_str).replace(tzinfo=self.tz_info)
+        return datetime.strptime(date_str, format_str or CONFIG.datetime.format).replace(tzinfo=self.tz_info)
 
+    @staticmethod
     def convert_datetime_timezone(date: datetime = None, from_tz: str = "UTC", to_tz: str = "Asia/Shanghai") -> datetime:
         """
         转换时区
         """
         if date is None:
             logger.info("Don't specify date, use current datetime")
-            date = datetime.now(ZoneInfo("UTC"))
+            date = datetime.now(_zone_info("UTC"))
         else:
             logger.info(f"Use specify date: {date}")
-        from_zone = ZoneInfo(from_tz)
-        date = date.replace(tzinfo=from_zone)
-        to_zone = ZoneInfo(to_tz)
-        return date.astimezone(to_zone)
+        date = date.replace(tzinfo=_zone_info(from_tz))
+        return date.astimezone(_zone_info(to_tz))
 
-    def get_date(self, days: int = -1, format_str: str = DATETIME_FORMAT) -> str:
+    def get_date(self, days: int = -1, format_str: str = None) -> str:
         target_date = datetime.now() + timedelta(days=days)
-        return target_date.strftime(format_str)
+        return target_date.strftime(format_str or CONFIG.datetime.format)
 
     def get_current_date(self, ret: str = None):
         current_date = datetime.now().date()
         if ret == "str":
-            return current_date.strftime(DATETIME_FORMAT.split(" ")[0])
+            return current_date.strftime(_split_format(CONFIG.datetime.format)[0])
         else:
             return current_date
 
     def get_current_time(self, ret: str = None):
         current_time = datetime.now().time()
         if ret == "str":
-            return current_time.strftime(DATETIME_FORMAT.split(" ")[1])
+            return current_time.strftime(_split_format(CONFIG.datetime.format)[1])
         else:
             return current_time
 
     def get_current_datetime(self, ret: str = None):
         current_datetime = datetime.now()
         if ret == "str":
-            return current_datetime.strftime(DATETIME_FORMAT)
+            return current_datetime.strftime(CONFIG.datetime.format)
         else:
             return current_datetime
 